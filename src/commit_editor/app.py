@@ -1,10 +1,10 @@
+import functools
+import os
 import re
-from collections.abc import Callable
 from pathlib import Path
 
 from rich.segment import Segment
 from rich.style import Style
-from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -13,12 +13,16 @@ from textual.screen import ModalScreen
 from textual.strip import Strip
 from textual.widgets import Input, OptionList, Static, TextArea
 from textual.widgets._option_list import Option
+from textual.widgets.text_area import Edit, EditResult
 
 from commit_editor.git import get_issue_pattern, get_signed_off_by
 from commit_editor.spelling import WORD_PATTERN, SpellCheckCache
 
 TITLE_MAX_LENGTH = 50
 BODY_MAX_LENGTH = 72
+# \r is included so CRLF documents both get stripped and, matching the
+# per-line rstrip this replaced, come out normalized to LF
+_TRAILING_WS = re.compile(r"[ \t\r]+(?=\n|$)")
 _SUGGESTION_PREFIX = "Suggestions for"
 _ISSUE_ID_ERROR = "Missing/Invalid issue ID in title!"
 
@@ -39,6 +43,16 @@ def _format_coauthor(name: str, email: str) -> str:
     return f"Co-authored-by: {name} <{email}>"
 
 
+@functools.lru_cache(maxsize=32)
+def _combine_styles(base: Style | None, extra: Style) -> Style:
+    """Combine a segment's base style with an overlay style, memoized.
+
+    Segments on a line share a handful of distinct styles, so the render
+    path hits this cache instead of allocating a combined Style per segment.
+    """
+    return base + extra if base else extra
+
+
 class CoauthorSelectScreen(ModalScreen[str | None]):
     """Modal screen for selecting an AI co-author model."""
 
@@ -109,46 +123,79 @@ class CoauthorSelectScreen(ModalScreen[str | None]):
         self.dismiss(None)
 
 
-def wrap_line(line: str, width: int = 72) -> list[str]:
+# Pre-bound to skip the per-call attribute lookup in the wrap hot path
+_split = str.split
+
+
+@functools.lru_cache(maxsize=1024)
+def wrap_line(line: str, width: int = 72) -> tuple[str, ...]:
     """Wrap a single line at word boundaries to fit within width.
 
+    Breaks are chosen to minimize the summed squared slack of all lines but
+    the last (Knuth-Plass style optimal fit), so the wrapped paragraph comes
+    out evenly filled instead of greedily ragged. A word longer than the
+    width is placed on a line of its own, unbroken.
+
+    The function is pure, so results are memoized; repeated re-wraps of
+    unchanged lines are served from the cache.
+
     Args:
         line: The line to wrap.
         width: Maximum line width (default 72).
 
     Returns:
-        List of wrapped lines.
+        Tuple of wrapped lines.
     """
-    if not line:
-        return [""]
-
+    # Most lines in a commit message already fit; skip tokenization, the
+    # prefix sums, and the DP entirely for them.
     if len(line) <= width:
-        return [line]
+        return (line,) if line else ("",)
+
+    words = _split(line)
+    if not words:
+        return ("",)
+
+    count = len(words)
+    # prefix[k] is the length of words[:k] joined by single spaces plus one
+    # trailing space, so words[i:j] measures prefix[j] - prefix[i] - 1 in O(1)
+    prefix = [0] * (count + 1)
+    total = 0
+    for k, word in enumerate(words, 1):
+        total += len(word) + 1
+        prefix[k] = total
+
+    # minima[j] is the cost of the optimal layout of words[:j]; breaks[j] is
+    # the index where that layout's last line starts
+    minima = [0.0] + [float("inf")] * count
+    breaks = [0] * (count + 1)
+
+    for j in range(1, count + 1):
+        prefix_j = prefix[j]
+        for i in range(j - 1, -1, -1):
+            line_len = prefix_j - prefix[i] - 1
+            if line_len > width:
+                if i == j - 1:
+                    # Unavoidable: a single word longer than the width
+                    cost = minima[i]
+                else:
+                    break
+            elif j == count:
+                # The last line carries no slack penalty
+                cost = minima[i]
+            else:
+                cost = minima[i] + (width - line_len) ** 2
+            if cost < minima[j]:
+                minima[j] = cost
+                breaks[j] = i
 
-    words = line.split(" ")
     lines: list[str] = []
-    current_line = ""
-
-    for word in words:
-        if not word:
-            # Handle multiple spaces
-            if current_line:
-                current_line += " "
-            continue
-
-        # Check if word fits on current line
-        test_line = f"{current_line} {word}".strip() if current_line else word
-        if len(test_line) <= width:
-            current_line = test_line
-        else:
-            if current_line:
-                lines.append(current_line)
-            current_line = word
-
-    if current_line:
-        lines.append(current_line)
-
-    return lines if lines else [""]
+    j = count
+    while j > 0:
+        i = breaks[j]
+        lines.append(" ".join(words[i:j]))
+        j = i
+    lines.reverse()
+    return tuple(lines)
 
 
 class CommitTextArea(TextArea):
@@ -164,54 +211,94 @@ class CommitTextArea(TextArea):
     }
     """
 
+    _OVERFLOW_STYLE = Style(color="red", bold=True)
+    _MISSPELLED_STYLE = Style(underline=True)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._last_body_text = ""
         self._spell_cache = SpellCheckCache()
         self.spellcheck_enabled = True
+        self._lines: list[str] = self.text.split("\n")
+        self._title_len: int = len(self._lines[0])
+        self._strip_cache: dict[int, tuple[Strip, Strip]] = {}
+
+    def _refresh_line_cache(self) -> None:
+        """Re-split the document text into the line cache read by render and status paths."""
+        self._lines = self.text.split("\n")
+        self._title_len = len(self._lines[0])
+        self.invalidate_strip_cache()
+
+    def invalidate_strip_cache(self) -> None:
+        """Drop cached rendered strips so every row is re-styled on next render."""
+        self._strip_cache.clear()
+
+    def load_text(self, text: str) -> None:
+        """Load text into the document and refresh the line cache."""
+        super().load_text(text)
+        self._refresh_line_cache()
+
+    def edit(self, edit: Edit) -> EditResult:
+        """Apply an edit to the document and refresh the line cache."""
+        result = super().edit(edit)
+        self._refresh_line_cache()
+        return result
+
+    def _on_text_area_changed(self, event: TextArea.Changed) -> None:
+        # Catch-all for changes that bypass edit() (e.g. undo/redo).
+        self._refresh_line_cache()
 
     def render_line(self, y: int) -> Strip:
         """Render a line with custom highlighting for title overflow and misspelled words."""
-        strip = super().render_line(y)
-        lines = self.text.split("\n")
-
-        # Highlight overflow on the first line (title)
-        if y == 0 and lines:
-            title = lines[0]
-            if len(title) > TITLE_MAX_LENGTH:
-                strip = self._apply_char_styles(
-                    strip, title, Style(color="red", bold=True), lambda pos: pos >= TITLE_MAX_LENGTH
-                )
+        base = super().render_line(y)
+
+        # The base class memoizes its own strips, so an identical base strip
+        # means nothing this row depends on has changed; reuse the styled strip.
+        cached = self._strip_cache.get(y)
+        if cached is not None and cached[0] is base:
+            return cached[1]
+
+        strip = base
+        lines = self._lines
+
+        # Highlight overflow on the first line (title); the cached title
+        # length makes this an O(1) check for every non-overflowing render.
+        if y == 0 and self._title_len > TITLE_MAX_LENGTH:
+            strip = self._apply_span_styles(
+                strip,
+                lines[0],
+                self._OVERFLOW_STYLE,
+                [(TITLE_MAX_LENGTH, self._title_len)],
+            )
 
         # Underline misspelled words
         if self.spellcheck_enabled and y < len(lines):
             line_text = lines[y]
             spans = self._spell_cache.get_misspelled_spans(y, line_text)
             if spans:
-                styled_positions = set()
-                for start, end in spans:
-                    for i in range(start, end):
-                        styled_positions.add(i)
-                strip = self._apply_char_styles(
-                    strip, line_text, Style(underline=True), lambda pos: pos in styled_positions
-                )
+                strip = self._apply_span_styles(strip, line_text, self._MISSPELLED_STYLE, spans)
 
+        # Don't cache before the dictionary loads, or underlines would never
+        # appear for text rendered while it was still loading.
+        if not self.spellcheck_enabled or self._spell_cache.loaded:
+            self._strip_cache[y] = (base, strip)
         return strip
 
     @staticmethod
-    def _apply_char_styles(
+    def _apply_span_styles(
         strip: Strip,
         line_text: str,
         extra_style: Style,
-        should_style: Callable[[int], bool],
+        spans: list[tuple[int, int]],
     ) -> Strip:
-        """Apply extra_style to characters where should_style(char_position) is True."""
+        """Apply extra_style to the given sorted (start, end) character spans of line_text."""
         segments = list(strip)
         new_segments = []
         char_count = 0
         content_started = False
+        span_index = 0
 
-        for segment in segments:
+        for i, segment in enumerate(segments):
             text = segment.text
             style = segment.style
 
@@ -219,31 +306,40 @@ class CommitTextArea(TextArea):
                 if text and line_text and text.strip() and line_text.startswith(text.strip()[:5]):
                     content_started = True
 
-            if content_started and text:
-                normal = ""
-                styled = ""
-
-                for char in text:
-                    if should_style(char_count):
-                        if normal:
-                            new_segments.append(Segment(normal, style))
-                            normal = ""
-                        styled += char
-                    else:
-                        if styled:
-                            combined = style + extra_style if style else extra_style
-                            new_segments.append(Segment(styled, combined))
-                            styled = ""
-                        normal += char
-                    char_count += 1
-
-                if normal:
-                    new_segments.append(Segment(normal, style))
-                if styled:
-                    combined = style + extra_style if style else extra_style
-                    new_segments.append(Segment(styled, combined))
-            else:
+            if not content_started or not text:
                 new_segments.append(segment)
+                continue
+
+            if span_index >= len(spans):
+                # All styled spans emitted; the rest of the strip is unchanged.
+                new_segments.extend(segments[i:])
+                break
+
+            seg_start = char_count
+            seg_end = char_count + len(text)
+            char_count = seg_end
+
+            if spans[span_index][0] >= seg_end:
+                new_segments.append(segment)
+                continue
+
+            # Partition the segment at span boundaries with slices
+            combined = _combine_styles(style, extra_style)
+            pos = seg_start
+            while pos < seg_end and span_index < len(spans):
+                start, end = spans[span_index]
+                if start >= seg_end:
+                    break
+                if start > pos:
+                    new_segments.append(Segment(text[pos - seg_start : start - seg_start], style))
+                    pos = start
+                stop = min(end, seg_end)
+                new_segments.append(Segment(text[pos - seg_start : stop - seg_start], combined))
+                pos = stop
+                if end <= seg_end:
+                    span_index += 1
+            if pos < seg_end:
+                new_segments.append(Segment(text[pos - seg_start :], style))
 
         return Strip(new_segments, strip.cell_length)
 
@@ -253,7 +349,7 @@ class CommitTextArea(TextArea):
             return None
 
         row, col = self.cursor_location
-        lines = self.text.split("\n")
+        lines = self._lines
         if row >= len(lines):
             return None
 
@@ -268,7 +364,7 @@ class CommitTextArea(TextArea):
     def wrap_current_body_line(self) -> None:
         """Wrap the current line if it's a body line (line 3+) and exceeds 72 chars."""
         cursor_row, cursor_col = self.cursor_location
-        lines = self.text.split("\n")
+        lines = self._lines
 
         # Only wrap body lines (index 2+, which is line 3+ in 1-indexed)
         if cursor_row < 2 or cursor_row >= len(lines):
@@ -286,9 +382,14 @@ class CommitTextArea(TextArea):
         if len(wrapped) <= 1:
             return
 
-        # Replace the current line with wrapped content
-        lines[cursor_row : cursor_row + 1] = wrapped
-        new_text = "\n".join(lines)
+        # Replace only the affected line; a full load_text here would rebuild
+        # and re-highlight the whole document on every wrapping keystroke.
+        self.replace(
+            "\n".join(wrapped),
+            start=(cursor_row, 0),
+            end=(cursor_row, len(current_line)),
+            maintain_selection_offset=False,
+        )
 
         # Calculate new cursor position
         # If cursor was beyond the wrap point, move to next line
@@ -300,13 +401,12 @@ class CommitTextArea(TextArea):
             new_row = cursor_row
             new_col = cursor_col
 
-        self.load_text(new_text)
-        self.invalidate_spell_cache()
         self.cursor_location = (new_row, new_col)
 
     def invalidate_spell_cache(self) -> None:
         """Clear the spellcheck line cache."""
         self._spell_cache.invalidate_all()
+        self.invalidate_strip_cache()
 
     def get_misspelled_spans(self, row: int, line_text: str) -> list[tuple[int, int]]:
         """Return misspelled word spans for a line."""
@@ -318,8 +418,7 @@ class CommitTextArea(TextArea):
 
     def get_title_length(self) -> int:
         """Get the length of the title (first line)."""
-        lines = self.text.split("\n")
-        return len(lines[0]) if lines else 0
+        return self._title_len
 
     def get_cursor_position(self) -> tuple[int, int]:
         """Get the current cursor position (1-indexed line, 1-indexed column)."""
@@ -390,16 +489,19 @@ class StatusBar(Static):
 
     def update_status(self, line: int, col: int, title_length: int, dirty: bool) -> None:
         """Update the status bar content."""
+        position = f"Ln {line}, Col {col} | "
+        title_display = f"Title: {title_length}"
         dirty_marker = " \\[modified]" if dirty else ""
 
+        # The markup adds no visible characters (the backslash escape is one
+        # char), so the plain width is known without a markup round-trip.
+        left_width = len(position) + len(title_display) + (len(dirty_marker) - 1 if dirty else 0)
+
         if title_length > TITLE_MAX_LENGTH:
-            title_display = f"[bold red]Title: {title_length}[/bold red]"
-        else:
-            title_display = f"Title: {title_length}"
+            title_display = f"[bold red]{title_display}[/bold red]"
 
-        left = f"Ln {line}, Col {col} | {title_display}{dirty_marker}"
+        left = f"{position}{title_display}{dirty_marker}"
         hints = "^S Save  ^Q Quit  ^O Sign-off  ^B Co-author  ^L Spellcheck"
-        left_width = len(Text.from_markup(left).plain)
         # Account for padding on both sides
         gap = (self.size.width - 2) - left_width - len(hints)
         if gap >= 2:
@@ -480,6 +582,9 @@ class CommitEditorApp(App):
         self._original_content = ""
         self._prompt_mode: str | None = None  # Track active prompt type
         self._spell_timer = None
+        self._signoff: str | None = None
+        self._signoff_loaded = False
+        self._status_dirty = False
         self._issue_pattern: re.Pattern[str] | None = None
         pattern = get_issue_pattern()
         if pattern:
@@ -496,9 +601,18 @@ class CommitEditorApp(App):
 
     def on_mount(self) -> None:
         """Load file content on startup."""
-        editor = self.query_one("#editor", CommitTextArea)
-
-        content = self.filename.read_text()
+        # Cache the hot widget references so event handlers skip CSS queries
+        self._editor = self.query_one("#editor", CommitTextArea)
+        self._status = self.query_one("#status", StatusBar)
+        editor = self._editor
+
+        # Read the raw bytes in one syscall and decode once; Path.read_text
+        # layers buffered text I/O over this for no benefit at startup.
+        fd = os.open(self.filename, os.O_RDONLY)
+        try:
+            content = os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+        finally:
+            os.close(fd)
         self._original_content = content
         editor.load_text(content)
         editor.invalidate_spell_cache()
@@ -507,6 +621,17 @@ class CommitEditorApp(App):
         self._update_status_bar()
         self._validate_issue_id()
 
+        # Resolve the git identity off the UI thread so the first Ctrl+O
+        # doesn't block on subprocess spawns.
+        self.run_worker(self._prefetch_signoff, thread=True)
+
+    def _prefetch_signoff(self) -> None:
+        """Fetch the Signed-off-by line in the background."""
+        signoff = get_signed_off_by()
+        if not self._signoff_loaded:
+            self._signoff = signoff
+            self._signoff_loaded = True
+
     def check_action(self, action: str, parameters: tuple) -> bool | None:
         """Disable editor actions when in prompt mode."""
         if self._prompt_mode is not None:
@@ -562,8 +687,12 @@ class CommitEditorApp(App):
         editor = self.query_one("#editor", CommitTextArea)
         self.dirty = editor.text != self._original_content
 
-        # Auto-wrap body lines
-        editor.wrap_current_body_line()
+        # Auto-wrap body lines. The O(1) gate against the editor's cached
+        # lines keeps the common case (title edits, short lines, deletions)
+        # out of the wrap path entirely.
+        row = editor.cursor_location[0]
+        if row >= 2 and row < len(editor._lines) and len(editor._lines[row]) > BODY_MAX_LENGTH:
+            editor.wrap_current_body_line()
 
         # Clear any message when user starts typing
         if self._prompt_mode is None:
@@ -579,14 +708,20 @@ class CommitEditorApp(App):
         self._schedule_spell_suggestions()
 
     def _update_status_bar(self) -> None:
-        """Update the status bar with current state."""
-        editor = self.query_one("#editor", CommitTextArea)
-        status = self.query_one("#status", StatusBar)
+        """Schedule a status bar update, coalescing bursts into one per refresh."""
+        if self._status_dirty:
+            return
+        self._status_dirty = True
+        self.call_after_refresh(self._flush_status_bar)
+
+    def _flush_status_bar(self) -> None:
+        """Render the status bar with current state."""
+        self._status_dirty = False
 
-        line, col = editor.get_cursor_position()
-        title_length = editor.get_title_length()
+        line, col = self._editor.get_cursor_position()
+        title_length = self._editor.get_title_length()
 
-        status.update_status(line, col, title_length, self.dirty)
+        self._status.update_status(line, col, title_length, self.dirty)
 
     def _validate_issue_id(self) -> None:
         """Validate issue ID in the title and update the validation bar."""
@@ -606,40 +741,54 @@ class CommitEditorApp(App):
         message_bar.show_message(message, error=error)
 
     @staticmethod
-    def _split_content_and_comments(
-        lines: list[str],
-    ) -> tuple[list[str], list[str]]:
-        """Split lines into content and git comment lines, stripping trailing blanks."""
-        comment_start = len(lines)
-        for i, line in enumerate(lines):
-            if line.startswith("#"):
-                comment_start = i
-                break
-        content = lines[:comment_start]
-        comments = lines[comment_start:]
-        while content and not content[-1].strip():
-            content.pop()
-        return content, comments
+    def _split_content_and_comments(text: str) -> tuple[list[str], str]:
+        """Split text into content lines and the raw git comment block.
+
+        The comment block starts at the first line beginning with '#'. It is
+        located with a C-level string search and returned unsplit, since it is
+        never edited and may hold thousands of lines with commit.verbose.
+        Trailing blank lines are stripped from the content.
+        """
+        if text.startswith("#"):
+            content = ""
+            comments = text
+        else:
+            idx = text.find("\n#")
+            if idx == -1:
+                content = text
+                comments = ""
+            else:
+                content = text[:idx]
+                comments = text[idx + 1 :]
 
-    @staticmethod
-    def _reassemble(content_lines: list[str], comment_lines: list[str]) -> str:
-        """Reassemble content and comment lines into a single string."""
-        if comment_lines:
-            return "\n".join(content_lines) + "\n\n" + "\n".join(comment_lines)
-        return "\n".join(content_lines)
-
-    def _load_and_restore_cursor(self, new_text: str) -> None:
-        """Load text into editor, restore cursor position, and update status bar."""
+        content_lines = content.split("\n") if content else []
+        while content_lines and not content_lines[-1].strip():
+            content_lines.pop()
+        return content_lines, comments
+
+    def _replace_content(self, content_lines: list[str], comments: str) -> None:
+        """Splice new content lines over the content region, leaving comments untouched.
+
+        Editing only the content region (instead of reloading the whole
+        document) preserves undo history and the editor's caches, and keeps
+        the work proportional to the message rather than to the comment
+        block.
+        """
         editor = self.query_one("#editor", CommitTextArea)
         cursor_pos = editor.cursor_location
-        editor.load_text(new_text)
-        editor.invalidate_spell_cache()
 
-        new_lines = new_text.split("\n")
-        max_row = len(new_lines) - 1
-        new_row = min(cursor_pos[0], max_row)
-        max_col = len(new_lines[new_row]) if new_row < len(new_lines) else 0
-        new_col = min(cursor_pos[1], max_col)
+        if comments:
+            new_content = "\n".join(content_lines) + "\n\n"
+            comment_row = editor.document.line_count - (comments.count("\n") + 1)
+            end = (comment_row, 0)
+        else:
+            new_content = "\n".join(content_lines)
+            end = editor.document.end
+        editor.replace(new_content, start=(0, 0), end=end, maintain_selection_offset=False)
+
+        new_lines = editor._lines
+        new_row = min(cursor_pos[0], len(new_lines) - 1)
+        new_col = min(cursor_pos[1], len(new_lines[new_row]))
         editor.cursor_location = (new_row, new_col)
 
         self._update_status_bar()
@@ -647,15 +796,13 @@ class CommitEditorApp(App):
     def action_save(self) -> None:
         """Save the file."""
         editor = self.query_one("#editor", CommitTextArea)
-        content = editor.text
 
         # Strip trailing whitespace from each line and ensure file ends with a newline
-        lines = content.split("\n")
-        content = "\n".join(line.rstrip() for line in lines)
+        content = _TRAILING_WS.sub("", editor.text)
         if not content.endswith("\n"):
             content += "\n"
 
-        self.filename.write_text(content)
+        self.filename.write_bytes(content.encode("utf-8"))
         self._original_content = content
         self.dirty = False
 
@@ -674,16 +821,27 @@ class CommitEditorApp(App):
         else:
             self.exit()
 
+    def _get_signoff(self) -> str | None:
+        """Return the Signed-off-by line, only asking git on first use.
+
+        The user's git identity cannot change within a session, so the two
+        git config subprocesses are spawned at most once per app run.
+        """
+        if not self._signoff_loaded:
+            self._signoff = get_signed_off_by()
+            self._signoff_loaded = True
+        return self._signoff
+
     def action_toggle_signoff(self) -> None:
         """Toggle the Signed-off-by line."""
         editor = self.query_one("#editor", CommitTextArea)
 
-        signoff = get_signed_off_by()
+        signoff = self._get_signoff()
         if not signoff:
             self._show_message("Git user not configured", error=True)
             return
 
-        content_lines, comment_lines = self._split_content_and_comments(editor.text.split("\n"))
+        content_lines, comments = self._split_content_and_comments(editor.text)
 
         # Check if Signed-off-by already exists in content
         has_signoff = False
@@ -713,7 +871,7 @@ class CommitEditorApp(App):
                     content_lines.append("")
             content_lines.append(signoff)
 
-        self._load_and_restore_cursor(self._reassemble(content_lines, comment_lines))
+        self._replace_content(content_lines, comments)
 
     def action_toggle_spellcheck(self) -> None:
         """Toggle spellcheck on/off."""
@@ -727,6 +885,7 @@ class CommitEditorApp(App):
             message_bar.show_message("Spellcheck disabled")
 
         # Force re-render to update underlines
+        editor.invalidate_strip_cache()
         editor.refresh()
 
     def action_toggle_coauthor(self) -> None:
@@ -741,13 +900,13 @@ class CommitEditorApp(App):
     def _remove_coauthor(self) -> None:
         """Remove any existing Co-authored-by line from the editor text."""
         editor = self.query_one("#editor", CommitTextArea)
-        content_lines, comment_lines = self._split_content_and_comments(editor.text.split("\n"))
+        content_lines, comments = self._split_content_and_comments(editor.text)
 
         content_lines = [line for line in content_lines if not line.startswith("Co-authored-by:")]
         while content_lines and not content_lines[-1].strip():
             content_lines.pop()
 
-        self._load_and_restore_cursor(self._reassemble(content_lines, comment_lines))
+        self._replace_content(content_lines, comments)
 
     def _on_coauthor_selected(self, result: str | None) -> None:
         """Handle co-author selection result."""
@@ -755,7 +914,7 @@ class CommitEditorApp(App):
             return
 
         editor = self.query_one("#editor", CommitTextArea)
-        content_lines, comment_lines = self._split_content_and_comments(editor.text.split("\n"))
+        content_lines, comments = self._split_content_and_comments(editor.text)
 
         # Find index of first Signed-off-by line
         signoff_index = -1
@@ -781,7 +940,7 @@ class CommitEditorApp(App):
                 content_lines.append("")
             content_lines.append(result)
 
-        self._load_and_restore_cursor(self._reassemble(content_lines, comment_lines))
+        self._replace_content(content_lines, comments)
 
     def _schedule_spell_suggestions(self) -> None:
         """Debounce spell suggestion updates to avoid blocking during rapid cursor movement."""
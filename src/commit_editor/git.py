@@ -1,55 +1,213 @@
-import subprocess
+import configparser
+import os
+import shutil
+from dataclasses import dataclass
+from functools import cached_property
 
+# Resolved once so each invocation skips the PATH search
+_GIT = shutil.which("git") or "git"
+_CONFIG: dict[str, str] | None = None
+_SOB = "Signed-off-by: {} <{}>".format
 
-def get_user_name() -> str | None:
+
+@dataclass(frozen=True)
+class Identity:
+    """The configured git user identity."""
+
+    name: str | None
+    email: str | None
+
+    @cached_property
+    def sob(self) -> str | None:
+        """The pre-formatted Signed-off-by line, or None when incomplete."""
+        if not self.name or not self.email:
+            return None
+        return _SOB(self.name, self.email)
+
+
+_IDENTITY: Identity | None = None
+
+
+def _identity() -> Identity:
+    """Return the cached user identity, building it from the config on first use."""
+    global _IDENTITY
+    if _IDENTITY is None:
+        config = _load_config()
+        _IDENTITY = Identity(config.get("user.name") or None, config.get("user.email") or None)
+    return _IDENTITY
+
+
+def _run_git(args: list[str]) -> tuple[bytes, int]:
+    """Run git with the given arguments and return (stdout, returncode).
+
+    On POSIX the child is started with os.posix_spawnp and a raw pipe, which
+    skips most of the subprocess module's per-call setup; other platforms
+    fall back to subprocess.run. Raises FileNotFoundError when git is not
+    installed.
+    """
+    if not hasattr(os, "posix_spawnp"):
+        # Deferred: subprocess drags in selectors/signal, and the POSIX
+        # spawn path above never needs it
+        import subprocess
+
+        result = subprocess.run([_GIT, *args], capture_output=True, check=False)
+        return result.stdout, result.returncode
+
+    read_fd, write_fd = os.pipe()
+    devnull = os.open(os.devnull, os.O_WRONLY)
     try:
-        result = subprocess.run(
-            ["git", "config", "user.name"],
-            capture_output=True,
-            text=True,
-            check=True,
+        pid = os.posix_spawnp(
+            _GIT,
+            [_GIT, *args],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, write_fd, 1),
+                (os.POSIX_SPAWN_DUP2, devnull, 2),
+                (os.POSIX_SPAWN_CLOSE, write_fd),
+                (os.POSIX_SPAWN_CLOSE, read_fd),
+            ],
         )
-        return result.stdout.strip() or None
-    except subprocess.CalledProcessError:
+    except OSError:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+        os.close(devnull)
+
+    chunks = []
+    while chunk := os.read(read_fd, 65536):
+        chunks.append(chunk)
+    os.close(read_fd)
+    _, status = os.waitpid(pid, 0)
+    return b"".join(chunks), os.waitstatus_to_exitcode(status)
+
+
+def _load_config() -> dict[str, str]:
+    """Load the entire git config once and serve all lookups from memory.
+
+    A single 'git config -l --null' invocation replaces one subprocess per
+    queried key; the parsed mapping is cached for the life of the process.
+    """
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = _read_config()
+    return _CONFIG
+
+
+# Backslash escapes git recognizes in config values
+_CONFIG_ESCAPES = {"\\": "\\", '"': '"', "n": "\n", "t": "\t", "b": "\b"}
+
+
+def _unescape_config_value(value: str) -> str:
+    """Undo git's config-file quoting so values match what 'git config' reads.
+
+    'git config' writes special characters escaped (a literal backslash is
+    stored as two) and may quote all or part of a value; reading the file
+    bytes verbatim would hand callers the escaped form.
+    """
+    if "\\" not in value and '"' not in value:
+        return value
+
+    chars = []
+    i = 0
+    end = len(value)
+    while i < end:
+        ch = value[i]
+        if ch == "\\" and i + 1 < end:
+            escaped = value[i + 1]
+            chars.append(_CONFIG_ESCAPES.get(escaped, escaped))
+            i += 2
+        elif ch == '"':
+            # Quotes only delimit verbatim spans; git drops them on read
+            i += 1
+        else:
+            chars.append(ch)
+            i += 1
+    return "".join(chars)
+
+
+# Keys the app needs; a parse missing any of them may just mean the value
+# lives in a scope the file parser does not cover (e.g. /etc/gitconfig)
+_NEEDED_KEYS = ("user.name", "user.email", "commit-editor.issue-pattern")
+
+
+def _read_gitconfig_files() -> dict[str, str] | None:
+    """Parse the gitconfig files directly, avoiding a subprocess entirely.
+
+    Reads the same files git consults for user-level config, in ascending
+    precedence. Returns None whenever the files may not tell the whole
+    story — no file exists, parsing fails, the config locations are
+    overridden, includes pull in other files, or a needed key is absent and
+    an uncovered scope could supply it — so the caller falls back to
+    invoking git.
+    """
+    if os.environ.get("GIT_CONFIG_GLOBAL") or os.environ.get("GIT_CONFIG_SYSTEM"):
         return None
-    except FileNotFoundError:
+    if os.path.isfile(".git"):
+        # A linked worktree; the repo config lives under the main worktree
         return None
 
-
-def get_user_email() -> str | None:
+    xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    paths = [
+        os.path.join(xdg, "git", "config"),
+        os.path.expanduser("~/.gitconfig"),
+        os.path.join(".git", "config"),
+    ]
+    parser = configparser.ConfigParser(strict=False, allow_no_value=True, interpolation=None)
     try:
-        result = subprocess.run(
-            ["git", "config", "user.email"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip() or None
-    except subprocess.CalledProcessError:
+        if not parser.read(paths):
+            return None
+    except (OSError, configparser.Error):
         return None
-    except FileNotFoundError:
+
+    config: dict[str, str] = {}
+    for section in parser.sections():
+        # '[remote "origin"]' style subsections flatten to 'remote.origin'
+        prefix = section.replace('"', "").replace(" ", ".").lower()
+        if prefix.split(".", 1)[0] in ("include", "includeif"):
+            # Only git can resolve included (possibly conditional) files
+            return None
+        for option, value in parser.items(section):
+            config[f"{prefix}.{option}"] = _unescape_config_value(value or "")
+
+    if any(key not in config for key in _NEEDED_KEYS):
         return None
+    return config
 
 
-def get_issue_pattern() -> str | None:
+def _read_config() -> dict[str, str]:
+    config = _read_gitconfig_files()
+    if config is not None:
+        return config
+
     try:
-        result = subprocess.run(
-            ["git", "config", "commit-editor.issue-pattern"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip() or None
-    except subprocess.CalledProcessError:
-        return None
+        stdout, returncode = _run_git(["config", "-l", "--null"])
     except FileNotFoundError:
-        return None
+        return {}
+    if returncode != 0:
+        return {}
 
+    config: dict[str, str] = {}
+    for record in stdout.split(b"\x00"):
+        if not record:
+            continue
+        # Records are "key\nvalue"; a value may itself contain newlines
+        key, _, value = record.partition(b"\n")
+        config[key.decode()] = value.decode()
+    return config
+
+
+def get_user_name() -> str | None:
+    return _identity().name
+
+
+def get_user_email() -> str | None:
+    return _identity().email
+
+
+def get_issue_pattern() -> str | None:
+    return _load_config().get("commit-editor.issue-pattern") or None
 
-def get_signed_off_by() -> str | None:
-    name = get_user_name()
-    email = get_user_email()
 
-    if name and email:
-        return f"Signed-off-by: {name} <{email}>"
-    return None
+def get_signed_off_by() -> str | None:
+    return _identity().sob
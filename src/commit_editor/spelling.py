@@ -19,6 +19,11 @@ class SpellCheckCache:
     def _load_dictionary(self) -> None:
         self._spell = SpellChecker()
 
+    @property
+    def loaded(self) -> bool:
+        """Whether the dictionary has finished loading."""
+        return self._spell is not None
+
     def get_misspelled_spans(self, line_num: int, line_text: str) -> list[tuple[int, int]]:
         """Return (start_col, end_col) spans of misspelled words on a line."""
         if self._spell is None:
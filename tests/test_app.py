@@ -54,6 +54,16 @@ class TestSaveFunction:
             assert saved_content == "Modified content\n"
             assert app.dirty is False
 
+    async def test_ctrl_s_strips_trailing_whitespace_from_crlf(self, temp_file):
+        """Saving a CRLF document should strip trailing whitespace and normalize to LF."""
+        temp_file.write_bytes(b"title   \r\nbody  \r\n")
+        app = CommitEditorApp(temp_file)
+
+        async with app.run_test() as pilot:
+            await pilot.press("ctrl+s")
+
+            assert temp_file.read_bytes() == b"title\nbody\n"
+
     async def test_ctrl_s_shows_message(self, temp_file):
         """Ctrl+S should show saved message with file path in message bar."""
         temp_file.write_text("Original")
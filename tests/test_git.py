@@ -1,6 +1,157 @@
 from unittest.mock import patch
 
-from commit_editor.git import get_issue_pattern, get_signed_off_by, get_user_email, get_user_name
+import pytest
+
+from commit_editor import git
+from commit_editor.git import (
+    Identity,
+    _read_gitconfig_files,
+    get_issue_pattern,
+    get_signed_off_by,
+    get_user_email,
+    get_user_name,
+)
+
+CONFIG_OUTPUT = (
+    b"user.name\nJohn Doe\x00"
+    b"user.email\njohn@example.com\x00"
+    b"commit-editor.issue-pattern\nAIPCC-\\d+\x00"
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Reset the caches and bypass the gitconfig file fast path around each test."""
+    git._CONFIG = None
+    git._IDENTITY = None
+    with patch("commit_editor.git._read_gitconfig_files", return_value=None):
+        yield
+    git._CONFIG = None
+    git._IDENTITY = None
+
+
+class TestLoadConfig:
+    """Tests for the cached git config loading."""
+
+    def test_single_invocation_serves_all_getters(self):
+        """All config lookups should share one git subprocess."""
+        with patch("commit_editor.git._run_git") as mock_run:
+            mock_run.return_value = (CONFIG_OUTPUT, 0)
+
+            assert get_user_name() == "John Doe"
+            assert get_user_email() == "john@example.com"
+            assert get_issue_pattern() == "AIPCC-\\d+"
+            assert mock_run.call_count == 1
+
+            mock_run.assert_called_once_with(["config", "-l", "--null"])
+
+    def test_multiline_value(self):
+        """Values containing newlines should be preserved intact."""
+        with patch("commit_editor.git._run_git") as mock_run:
+            mock_run.return_value = (b"user.name\nJohn\nDoe\x00", 0)
+
+            assert get_user_name() == "John\nDoe"
+
+
+class TestReadGitconfigFiles:
+    """Tests for the direct gitconfig file parser."""
+
+    FULL_CONFIG = (
+        "[user]\n"
+        "\tname = John Doe\n"
+        "\temail = john@example.com\n"
+        "[commit-editor]\n"
+        "\tissue-pattern = AIPCC-1\n"
+    )
+
+    @pytest.fixture(autouse=True)
+    def isolated_home(self, tmp_path, monkeypatch):
+        """Point every gitconfig location at an empty temp directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+        monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+        monkeypatch.delenv("GIT_CONFIG_SYSTEM", raising=False)
+        monkeypatch.chdir(tmp_path)
+
+    def test_no_files_returns_none(self):
+        """Should return None so the caller falls back to invoking git."""
+        assert _read_gitconfig_files() is None
+
+    def test_parses_sections(self, tmp_path):
+        """Should flatten sections into the same keys git config reports."""
+        (tmp_path / ".gitconfig").write_text(self.FULL_CONFIG)
+
+        config = _read_gitconfig_files()
+        assert config == {
+            "user.name": "John Doe",
+            "user.email": "john@example.com",
+            "commit-editor.issue-pattern": "AIPCC-1",
+        }
+
+    def test_later_file_overrides_earlier(self, tmp_path):
+        """Repo-level config should take precedence over the user-level files."""
+        (tmp_path / ".gitconfig").write_text(self.FULL_CONFIG)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config").write_text("[user]\n\tname = Work Account\n")
+
+        config = _read_gitconfig_files()
+        assert config["user.name"] == "Work Account"
+
+    def test_include_section_falls_back(self, tmp_path):
+        """Includes can only be resolved by git, so the parse is not trusted."""
+        (tmp_path / ".gitconfig").write_text(
+            self.FULL_CONFIG + "[include]\n\tpath = ~/identity.inc\n"
+        )
+
+        assert _read_gitconfig_files() is None
+
+    def test_missing_needed_key_falls_back(self, tmp_path):
+        """A key missing from the files may still be set in an uncovered scope."""
+        (tmp_path / ".gitconfig").write_text("[user]\n\tname = John Doe\n")
+
+        assert _read_gitconfig_files() is None
+
+    def test_config_location_override_falls_back(self, tmp_path, monkeypatch):
+        """GIT_CONFIG_GLOBAL redirects git away from the files we would read."""
+        (tmp_path / ".gitconfig").write_text(self.FULL_CONFIG)
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "other"))
+
+        assert _read_gitconfig_files() is None
+
+    def test_linked_worktree_falls_back(self, tmp_path):
+        """A .git file means the repo config lives under the main worktree."""
+        (tmp_path / ".gitconfig").write_text(self.FULL_CONFIG)
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/wt\n")
+
+        assert _read_gitconfig_files() is None
+
+    def test_unescapes_config_values(self, tmp_path):
+        """Values should match what 'git config' reads back, not the file bytes."""
+        # 'git config commit-editor.issue-pattern AIPCC-\d+' stores the
+        # backslash escaped; quotes are delimiters, with \" for literal ones
+        (tmp_path / ".gitconfig").write_text(
+            "[commit-editor]\n"
+            "\tissue-pattern = AIPCC-\\\\d+\n"
+            "[user]\n"
+            '\tname = "John \\"JD\\" Doe"\n'
+            "\temail = john@example.com\n"
+        )
+
+        config = _read_gitconfig_files()
+        assert config == {
+            "commit-editor.issue-pattern": "AIPCC-\\d+",
+            "user.name": 'John "JD" Doe',
+            "user.email": "john@example.com",
+        }
+
+    def test_serves_lookups_without_subprocess(self):
+        """Config getters should not spawn git when the files can be parsed."""
+        with (
+            patch("commit_editor.git._read_gitconfig_files", return_value={"user.name": "Jane"}),
+            patch("commit_editor.git._run_git") as mock_run,
+        ):
+            assert get_user_name() == "Jane"
+            mock_run.assert_not_called()
 
 
 class TestGetUserName:
@@ -8,69 +159,48 @@ class TestGetUserName:
 
     def test_successful_config_read(self):
         """Should return user name when git config succeeds."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "John Doe\n"
-            mock_run.return_value.returncode = 0
-
-            result = get_user_name()
-            assert result == "John Doe"
-
-            mock_run.assert_called_once_with(
-                ["git", "config", "user.name"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        with patch("commit_editor.git._CONFIG", {"user.name": "John Doe"}):
+            assert get_user_name() == "John Doe"
 
     def test_missing_config(self):
         """Should return None when git config is not set."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            from subprocess import CalledProcessError
-
-            mock_run.side_effect = CalledProcessError(1, "git config")
-
-            result = get_user_name()
-            assert result is None
+        with patch("commit_editor.git._CONFIG", {}):
+            assert get_user_name() is None
 
     def test_git_not_found(self):
         """Should return None when git is not installed."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
+        with patch("commit_editor.git._run_git") as mock_run:
             mock_run.side_effect = FileNotFoundError()
 
             result = get_user_name()
             assert result is None
 
-    def test_empty_config(self):
-        """Should return None when git config returns empty string."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "\n"
-            mock_run.return_value.returncode = 0
+    def test_git_config_fails(self):
+        """Should return None when git config exits non-zero."""
+        with patch("commit_editor.git._run_git") as mock_run:
+            mock_run.return_value = (b"", 1)
 
             result = get_user_name()
             assert result is None
 
+    def test_empty_config(self):
+        """Should return None when git config holds an empty value."""
+        with patch("commit_editor.git._CONFIG", {"user.name": ""}):
+            assert get_user_name() is None
+
 
 class TestGetUserEmail:
     """Tests for get_user_email function."""
 
     def test_successful_config_read(self):
         """Should return user email when git config succeeds."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "john@example.com\n"
-            mock_run.return_value.returncode = 0
-
-            result = get_user_email()
-            assert result == "john@example.com"
+        with patch("commit_editor.git._CONFIG", {"user.email": "john@example.com"}):
+            assert get_user_email() == "john@example.com"
 
     def test_missing_config(self):
         """Should return None when git config is not set."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            from subprocess import CalledProcessError
-
-            mock_run.side_effect = CalledProcessError(1, "git config")
-
-            result = get_user_email()
-            assert result is None
+        with patch("commit_editor.git._CONFIG", {}):
+            assert get_user_email() is None
 
 
 class TestGetSignedOffBy:
@@ -78,83 +208,59 @@ class TestGetSignedOffBy:
 
     def test_returns_formatted_line(self):
         """Should return properly formatted Signed-off-by line."""
-        with (
-            patch("commit_editor.git.get_user_name") as mock_name,
-            patch("commit_editor.git.get_user_email") as mock_email,
-        ):
-            mock_name.return_value = "John Doe"
-            mock_email.return_value = "john@example.com"
-
+        with patch("commit_editor.git._IDENTITY", Identity("John Doe", "john@example.com")):
             result = get_signed_off_by()
             assert result == "Signed-off-by: John Doe <john@example.com>"
 
     def test_returns_none_when_name_missing(self):
         """Should return None when user name is not configured."""
-        with (
-            patch("commit_editor.git.get_user_name") as mock_name,
-            patch("commit_editor.git.get_user_email") as mock_email,
-        ):
-            mock_name.return_value = None
-            mock_email.return_value = "john@example.com"
-
+        with patch("commit_editor.git._IDENTITY", Identity(None, "john@example.com")):
             result = get_signed_off_by()
             assert result is None
 
     def test_returns_none_when_email_missing(self):
         """Should return None when user email is not configured."""
-        with (
-            patch("commit_editor.git.get_user_name") as mock_name,
-            patch("commit_editor.git.get_user_email") as mock_email,
-        ):
-            mock_name.return_value = "John Doe"
-            mock_email.return_value = None
-
+        with patch("commit_editor.git._IDENTITY", Identity("John Doe", None)):
             result = get_signed_off_by()
             assert result is None
 
+    def test_sob_computed_once(self):
+        """The formatted line should be cached on the identity instance."""
+        identity = Identity("John Doe", "john@example.com")
+        assert identity.sob is identity.sob
+
+    def test_single_git_invocation(self):
+        """Should resolve both identity values with a single subprocess."""
+        with patch("commit_editor.git._run_git") as mock_run:
+            mock_run.return_value = (CONFIG_OUTPUT, 0)
+
+            result = get_signed_off_by()
+            assert result == "Signed-off-by: John Doe <john@example.com>"
+            assert mock_run.call_count == 1
+
 
 class TestGetIssuePattern:
     """Tests for get_issue_pattern function."""
 
     def test_successful_config_read(self):
         """Should return the pattern string when git config succeeds."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "AIPCC-\\d+\n"
-            mock_run.return_value.returncode = 0
-
-            result = get_issue_pattern()
-            assert result == "AIPCC-\\d+"
-
-            mock_run.assert_called_once_with(
-                ["git", "config", "commit-editor.issue-pattern"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+        with patch("commit_editor.git._CONFIG", {"commit-editor.issue-pattern": "AIPCC-\\d+"}):
+            assert get_issue_pattern() == "AIPCC-\\d+"
 
     def test_missing_config(self):
         """Should return None when git config is not set."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            from subprocess import CalledProcessError
-
-            mock_run.side_effect = CalledProcessError(1, "git config")
-
-            result = get_issue_pattern()
-            assert result is None
+        with patch("commit_editor.git._CONFIG", {}):
+            assert get_issue_pattern() is None
 
     def test_git_not_found(self):
         """Should return None when git is not installed."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
+        with patch("commit_editor.git._run_git") as mock_run:
             mock_run.side_effect = FileNotFoundError()
 
             result = get_issue_pattern()
             assert result is None
 
     def test_empty_config(self):
-        """Should return None when git config returns empty string."""
-        with patch("commit_editor.git.subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "\n"
-            mock_run.return_value.returncode = 0
-
-            result = get_issue_pattern()
-            assert result is None
+        """Should return None when git config holds an empty value."""
+        with patch("commit_editor.git._CONFIG", {"commit-editor.issue-pattern": ""}):
+            assert get_issue_pattern() is None
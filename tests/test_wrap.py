@@ -10,17 +10,17 @@ class TestWrapLine:
         """Short lines should not be wrapped."""
         line = "This is a short line"
         result = wrap_line(line, 72)
-        assert result == ["This is a short line"]
+        assert result == ("This is a short line",)
 
     def test_empty_input(self):
-        """Empty input should return empty string in list."""
-        assert wrap_line("", 72) == [""]
+        """Empty input should return empty string in a tuple."""
+        assert wrap_line("", 72) == ("",)
 
     def test_exact_length(self):
         """Line at exactly max length should not be wrapped."""
         line = "a" * 72
         result = wrap_line(line, 72)
-        assert result == [line]
+        assert result == (line,)
 
     def test_wrap_at_word_boundary(self):
         """Long lines should wrap at word boundaries."""
@@ -35,14 +35,21 @@ class TestWrapLine:
         """Very long words (e.g. URLs) should not be broken."""
         line = "a" * 100
         result = wrap_line(line, 72)
-        assert result == ["a" * 100]
+        assert result == ("a" * 100,)
 
     def test_long_word_with_surrounding_text(self):
         """A long word should be placed on its own line without breaking."""
         url = "https://example.com/" + "a" * 80
         line = f"See {url} for details"
         result = wrap_line(line, 72)
-        assert result == ["See", url, "for details"]
+        assert result == ("See", url, "for details")
+
+    def test_optimal_breaks(self):
+        """Breaks should minimize raggedness instead of greedily filling lines."""
+        # Greedy first-fit would produce ["aaa bb", "cc", "ddddd"], leaving a
+        # badly ragged middle line; the optimal fit spreads the slack evenly.
+        result = wrap_line("aaa bb cc ddddd", 6)
+        assert result == ("aaa", "bb cc", "ddddd")
 
     def test_multiple_wraps(self):
         """Very long lines should wrap multiple times."""